@@ -7,3 +7,7 @@ from .point import CartesianND  # noqa
 from .point import Cartesian1D  # noqa
 from .point import Cartesian2D  # noqa
 from .point import Cartesian3D  # noqa
+
+from .point_array import Cartesian3DArray  # noqa
+
+from ._codegen import make_cartesian  # noqa
@@ -0,0 +1,175 @@
+"""
+This module contains the function `make_cartesian`, which creates concrete classes
+for expressing points in continuous cartesian space of any given dimension.
+
+Cartesian1D, Cartesian2D, and Cartesian3D cover the most common cases. Points with
+more dimensions can be held by CartesianND, but its operators loop over however many
+coordinates there are. The classes created here have the source code of their
+operators generated for their dimension, with one term written out per coordinate.
+"""
+
+from __future__ import annotations
+
+from .point import CartesianND
+from .point import Cartesian1D
+from .point import Cartesian2D
+from .point import Cartesian3D
+from .point import _as_float
+from .point import _is_real
+from .point import _FAST_SCALAR_TYPES
+
+# the hand-written classes are returned for their dimensions, instead of generating a
+# second, unrelated class with the same name
+_CARTESIAN_CLASSES: dict[int, type[CartesianND]] = {
+    1: Cartesian1D,
+    2: Cartesian2D,
+    3: Cartesian3D,
+}
+
+
+def make_cartesian(n_dims: int) -> type[CartesianND]:
+    """
+    Return the concrete CartesianND subclass for points with `n_dims` dimensions. The
+    class is created the first time it is requested, and reused after that.
+
+    For example, `Cartesian5D = make_cartesian(5)` creates a class whose instances are
+    created as `Cartesian5D(x0, x1, x2, x3, x4)`.
+    """
+    if n_dims <= 0:
+        raise ValueError("A Cartesian class must have `n_dims` of 1 or greater.")
+
+    cartesian_class = _CARTESIAN_CLASSES.get(n_dims)
+    if cartesian_class is None:
+        cartesian_class = _generate_cartesian_class(n_dims)
+        _CARTESIAN_CLASSES[n_dims] = cartesian_class
+
+    return cartesian_class
+
+
+def _generate_cartesian_class(n_dims: int) -> type[CartesianND]:
+    """Create the CartesianND subclass for `n_dims` dimensions from generated source code."""
+    class_name = f"Cartesian{n_dims}D"
+    namespace = {
+        "CartesianND": CartesianND,
+        "_new": object.__new__,
+        "_as_float": _as_float,
+        "_is_real": _is_real,
+        "_FAST_SCALAR_TYPES": _FAST_SCALAR_TYPES,
+        "_unpickle": _unpickle_cartesian,
+    }
+    exec(_cartesian_class_source(class_name, n_dims), namespace)
+
+    cartesian_class: type[CartesianND] = namespace[class_name]  # type: ignore[assignment]
+    cartesian_class.__module__ = __name__
+
+    return cartesian_class
+
+
+def _unpickle_cartesian(n_dims: int, coords: tuple[float, ...]) -> CartesianND:
+    """
+    Recreate a pickled point. The generated classes can't be found by name in any module,
+    so they are looked up again through `make_cartesian`.
+    """
+    point = object.__new__(make_cartesian(n_dims))
+    point._coords = coords
+    point._n_dims = n_dims
+    return point
+
+
+def _cartesian_class_source(class_name: str, n_dims: int) -> str:
+    """
+    The source code of the class. The operators build their results by setting the slots
+    of a new instance directly, since the new coordinates are already floats.
+    """
+    i_dims = range(n_dims)
+
+    def coords_tuple(terms: list[str]) -> str:
+        return "(" + ", ".join(terms) + ("," if n_dims == 1 else "") + ")"
+
+    args = ", ".join([f"x{i}" for i in i_dims])
+    init_coords = coords_tuple(
+        [f"x{i} if type(x{i}) is float else _as_float(x{i})" for i in i_dims]
+    )
+    add_coords = coords_tuple([f"a[{i}] + b[{i}]" for i in i_dims])
+    sub_coords = coords_tuple([f"a[{i}] - b[{i}]" for i in i_dims])
+    mul_coords = coords_tuple([f"other * a[{i}]" for i in i_dims])
+    floordiv_coords = coords_tuple([f"a[{i}] // other" for i in i_dims])
+    truediv_coords = coords_tuple([f"a[{i}] / other" for i in i_dims])
+    origin_args = ", ".join(["0.0"] * n_dims)
+
+    return f'''
+class {class_name}(CartesianND):
+    """Represents a point in {n_dims}D cartesian space."""
+
+    __slots__ = ()
+
+    def __init__(self, {args}):
+        self._coords = {init_coords}
+        self._n_dims = {n_dims}
+
+    def __add__(self, other):
+        """Element-wise addition of two points in cartesian space."""
+        if other._n_dims != {n_dims}:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new({class_name})
+        point._coords = {add_coords}
+        point._n_dims = {n_dims}
+        return point
+
+    def __sub__(self, other):
+        """Element-wise subtraction of two points in cartesian space."""
+        if other._n_dims != {n_dims}:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new({class_name})
+        point._coords = {sub_coords}
+        point._n_dims = {n_dims}
+        return point
+
+    def __mul__(self, other):
+        """Scalar multiplication of the point in cartesian space by a number."""
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        a = self._coords
+        point = _new({class_name})
+        point._coords = {mul_coords}
+        point._n_dims = {n_dims}
+        return point
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide {class_name} coordinates by 0")
+        a = self._coords
+        point = _new({class_name})
+        point._coords = {floordiv_coords}
+        point._n_dims = {n_dims}
+        return point
+
+    def __truediv__(self, other):
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide {class_name} coordinates by 0")
+        a = self._coords
+        point = _new({class_name})
+        point._coords = {truediv_coords}
+        point._n_dims = {n_dims}
+        return point
+
+    def __reduce__(self):
+        return (_unpickle, ({n_dims}, self._coords))
+
+    @classmethod
+    def origin(cls):
+        return _ORIGIN
+
+
+_ORIGIN = {class_name}({origin_args})
+'''
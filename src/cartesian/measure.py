@@ -3,7 +3,9 @@ This module contains functions to calculate the distance between two instances
 of Cartesian1D, Cartesian2D, or Cartesian3D. The distances may be in free space,
 or in a periodic box.
 
-There are also functions to return the squared distance between two points.
+There are also functions to return the squared distance between two points, and a
+function that calculates the distance between two points along with both of their
+norms in a single call.
 """
 
 import math
@@ -14,36 +16,65 @@ from .periodic_box_sides import PeriodicBoxSidesND
 
 def euclidean_distance_squared(point0: CartesianND, point1: CartesianND) -> float:
     """The square of the Euclidean distance between two points in N-dimensional free space."""
-    if point0.n_dims != point1.n_dims:
+    n_dims = point0._n_dims
+    if n_dims != point1._n_dims:
         return NotImplemented
 
-    distance_sq = sum(
-        [
-            (coord0 - coord1) ** 2
-            for (coord0, coord1) in zip(point0.coordinates, point1.coordinates)
-        ]
-    )
+    coords0 = point0._coords
+    coords1 = point1._coords
+
+    # 1D, 2D, and 3D are written out by hand
+    if n_dims == 3:
+        sep0 = coords0[0] - coords1[0]
+        sep1 = coords0[1] - coords1[1]
+        sep2 = coords0[2] - coords1[2]
+        return sep0 * sep0 + sep1 * sep1 + sep2 * sep2
+    elif n_dims == 2:
+        sep0 = coords0[0] - coords1[0]
+        sep1 = coords0[1] - coords1[1]
+        return sep0 * sep0 + sep1 * sep1
+    elif n_dims == 1:
+        sep0 = coords0[0] - coords1[0]
+        return sep0 * sep0
+
+    distance_sq = 0.0
+    for (coord0, coord1) in zip(coords0, coords1):
+        separation = coord0 - coord1
+        distance_sq += separation * separation
 
     return distance_sq
 
 
 def euclidean_distance(point0: CartesianND, point1: CartesianND) -> float:
     """The Euclidean distance between two points in N-dimensional free space."""
-    result_distance_sq = euclidean_distance_squared(point0, point1)
-    if result_distance_sq is NotImplemented:
+    if point0._n_dims != point1._n_dims:
         return NotImplemented
-    else:
-        return math.sqrt(result_distance_sq)
+
+    return math.dist(point0._coords, point1._coords)
 
 
 def euclidean_norm_squared(point: CartesianND) -> float:
     """The square of the Euclidean norm of a point, from the origin, in free space."""
-    return sum([coord**2 for coord in point.coordinates])
+    coords = point._coords
+    n_dims = point._n_dims
+
+    if n_dims == 3:
+        return coords[0] * coords[0] + coords[1] * coords[1] + coords[2] * coords[2]
+    elif n_dims == 2:
+        return coords[0] * coords[0] + coords[1] * coords[1]
+    elif n_dims == 1:
+        return coords[0] * coords[0]
+
+    norm_sq = 0.0
+    for coord in coords:
+        norm_sq += coord * coord
+
+    return norm_sq
 
 
 def euclidean_norm(point: CartesianND) -> float:
     """The Euclidean norm of a point, from the origin, in free space."""
-    return math.sqrt(euclidean_norm_squared(point))
+    return math.hypot(*point._coords)
 
 
 def _periodic_modulus_pairdist(pair_separation: float, sidelength: float) -> float:
@@ -54,18 +85,24 @@ def _periodic_modulus_pairdist(pair_separation: float, sidelength: float) -> flo
 
     The output will be between
         '-0.5 * sidelength' and '0.5 * sidelength'
+
+    The separation is shifted by the nearest whole number of sidelengths, which avoids
+    branching on the sign and size of the separation. A separation of exactly half a
+    sidelength is mapped to '-0.5 * sidelength'.
     """
-    abs_pair_separation = abs(pair_separation)
+    return _periodic_min_image(pair_separation, sidelength, 1.0 / sidelength)
 
-    if 2.0 * abs_pair_separation > sidelength:
-        sign = math.copysign(1, pair_separation)
-        n_shifts = math.ceil((abs_pair_separation / sidelength) - 0.5)
 
-        total_position_shift = sign * n_shifts * sidelength
-        true_pair_separation = pair_separation - total_position_shift
-        return true_pair_separation
-    else:
-        return pair_separation
+def _periodic_min_image(
+    pair_separation: float, sidelength: float, inv_sidelength: float
+) -> float:
+    """
+    Same as `_periodic_modulus_pairdist`, but takes the precomputed reciprocal of the
+    sidelength (see `PeriodicBoxSidesND._inv_coords`) to multiply by instead of divide.
+    """
+    return pair_separation - sidelength * math.floor(
+        pair_separation * inv_sidelength + 0.5
+    )
 
 
 def periodic_euclidean_distance_squared(
@@ -75,20 +112,25 @@ def periodic_euclidean_distance_squared(
     The square of the Euclidean distance between two points subject to periodic
     boundary conditions imposed by `box`.
     """
-    if point0.n_dims != point1.n_dims:
+    if point0._n_dims != point1._n_dims:
         return NotImplemented
 
-    if point0.n_dims != box.n_dims:
+    if point0._n_dims != box.n_dims:
         err_msg = "The points and the box must have the same number of dimensions."
         raise RuntimeError(err_msg)
 
+    # the minimum-image shift from `_periodic_min_image` is written out in the loop, to
+    # avoid a Python function call for every coordinate
     distance_sq = 0.0
-    for (coord0, coord1, sidelength) in zip(
-        point0.coordinates, point1.coordinates, box.coordinates
+    for (coord0, coord1, sidelength, inv_sidelength) in zip(
+        point0._coords, point1._coords, box._coords, box._inv_coords
     ):
-        true_pair_separation = _periodic_modulus_pairdist(coord1 - coord0, sidelength)
+        pair_separation = coord1 - coord0
+        true_pair_separation = pair_separation - sidelength * math.floor(
+            pair_separation * inv_sidelength + 0.5
+        )
 
-        distance_sq += true_pair_separation**2
+        distance_sq += true_pair_separation * true_pair_separation
 
     return distance_sq
 
@@ -114,15 +156,20 @@ def periodic_euclidean_norm_squared(
     The square of the Euclidean norm of a point, subject to periodic boundary conditions
     imposed by `box`.
     """
-    if point.n_dims != box.n_dims:
+    if point._n_dims != box.n_dims:
         err_msg = "The points and the box must have the same number of dimensions."
         raise RuntimeError(err_msg)
 
+    # inlined `_periodic_min_image`, as in `periodic_euclidean_distance_squared`
     distance_sq = 0.0
-    for (coord, sidelength) in zip(point.coordinates, box.coordinates):
-        true_pair_separation = _periodic_modulus_pairdist(coord, sidelength)
+    for (coord, sidelength, inv_sidelength) in zip(
+        point._coords, box._coords, box._inv_coords
+    ):
+        true_pair_separation = coord - sidelength * math.floor(
+            coord * inv_sidelength + 0.5
+        )
 
-        distance_sq += true_pair_separation**2
+        distance_sq += true_pair_separation * true_pair_separation
 
     return distance_sq
 
@@ -132,6 +179,26 @@ def periodic_euclidean_norm(point: CartesianND, box: PeriodicBoxSidesND) -> floa
     return math.sqrt(periodic_euclidean_norm_squared(point, box))
 
 
+def distance_and_norms(
+    point0: CartesianND, point1: CartesianND
+) -> tuple[float, float, float]:
+    """
+    The Euclidean distance between two points in free space, followed by the Euclidean
+    norms of `point0` and `point1`.
+    """
+    if point0._n_dims != point1._n_dims:
+        raise ValueError(
+            "Two points must have the same dimensionality to calculate their distance.\n"
+            f"point0.n_dims = {point0.n_dims}\n"
+            f"point1.n_dims = {point1.n_dims}"
+        )
+
+    coords0 = point0._coords
+    coords1 = point1._coords
+
+    return math.dist(coords0, coords1), math.hypot(*coords0), math.hypot(*coords1)
+
+
 def approx_eq(
     point0: CartesianND, point1: CartesianND, tolerance: float = 1.0e-6
 ) -> bool:
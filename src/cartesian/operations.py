@@ -2,46 +2,71 @@
 This module contains functions to perform common operations on CartesianND points,
 such as:
     - taking linear combinations of several points
+    - calculating the centroid of several points, and moving them around it
+    - calculating the distances, or squared distances, between all pairs of points
+    - calculating the distances from a reference point to many other points
     - ...
+
+The functions that operate on many points first collect all of their coordinates
+together. When the same points are passed in over and over (e.g. in every step of a
+simulation), storing them in a `Cartesian3DArray` lets these functions use its
+coordinate columns as they are, instead of collecting them again on every call.
 """
 
-import array
+from __future__ import annotations
+
 import math
+import operator
 from itertools import combinations
+from typing import Optional
 from typing import Sequence
 
 from cartesian import Cartesian2D
 from cartesian import Cartesian3D
 from cartesian import CartesianND
-from cartesian.measure import euclidean_distance
-from cartesian.measure import periodic_euclidean_distance
+from cartesian.point_array import Cartesian3DArray
 from cartesian.periodic_box_sides import PeriodicBoxSidesND
 
 
 def dot_product(p0: CartesianND, p1: CartesianND) -> float:
     """The N-dimensional Cartesian inner product between these two points."""
-    if p0.n_dims != p1.n_dims:
+    n_dims = p0._n_dims
+    if n_dims != p1._n_dims:
         raise ValueError(
             "Two points must have the same dimensionality to calculate their dot product.\n"
-            f"p0.n_dims = {p0.n_dims}\n"
+            f"p0.n_dims = {n_dims}\n"
             f"p1.n_dims = {p1.n_dims}"
         )
 
-    return sum(
-        [elem0 * elem1 for (elem0, elem1) in zip(p0.coordinates, p1.coordinates)]
-    )
+    coords0 = p0._coords
+    coords1 = p1._coords
+
+    if n_dims == 3:
+        return (
+            coords0[0] * coords1[0] + coords0[1] * coords1[1] + coords0[2] * coords1[2]
+        )
+    elif n_dims == 2:
+        return coords0[0] * coords1[0] + coords0[1] * coords1[1]
+    elif n_dims == 1:
+        return coords0[0] * coords1[0]
+
+    dot = 0.0
+    for (elem0, elem1) in zip(coords0, coords1):
+        dot += elem0 * elem1
+
+    return dot
 
 
 def cross_product(pa: Cartesian3D, pb: Cartesian3D) -> Cartesian3D:
-    if pa.n_dims != 3 or pb.n_dims != 3:
+    if pa._n_dims != 3 or pb._n_dims != 3:
         raise ValueError(
             "The cross product is only defined between two 3-dimensional vectors.\n"
             f"pa.n_dims = {pa.n_dims}\n"
             f"pb.n_dims = {pb.n_dims}"
         )
 
-    coords_a = pa.coordinates
-    coords_b = pb.coordinates
+    coords_a = pa._coords
+    coords_b = pb._coords
 
     result0 = coords_a[1] * coords_b[2] - coords_a[2] * coords_b[1]
     result1 = coords_a[2] * coords_b[0] - coords_a[0] * coords_b[2]
@@ -51,15 +76,15 @@ def cross_product(pa: Cartesian3D, pb: Cartesian3D) -> Cartesian3D:
 
 
 def cross_product_result(pa: Cartesian2D, pb: Cartesian2D) -> float:
-    if pa.n_dims != 2 or pb.n_dims != 2:
+    if pa._n_dims != 2 or pb._n_dims != 2:
         raise ValueError(
             "The cross product result is only defined between two 2-dimensional vectors.\n"
             f"pa.n_dims = {pa.n_dims}\n"
             f"pb.n_dims = {pb.n_dims}"
         )
 
-    coords_a = pa.coordinates
-    coords_b = pb.coordinates
+    coords_a = pa._coords
+    coords_b = pb._coords
 
     return coords_a[0] * coords_b[1] - coords_a[1] * coords_b[0]
 
@@ -67,13 +92,21 @@ def cross_product_result(pa: Cartesian2D, pb: Cartesian2D) -> float:
 def linear_combination(
     points: Sequence[CartesianND], coeffs: Sequence[float]
 ) -> CartesianND:
-    assert len(points) == len(coeffs) > 0
+    # checked explicitly instead of with `assert`, so the check survives `python -O`;
+    # otherwise `map()` below would silently drop the extra points or coefficients
+    n_points = len(points)
+    if n_points == 0 or n_points != len(coeffs):
+        raise AssertionError(
+            "There must be at least one point, and one coefficient per point.\n"
+            f"number of points = {n_points}\n"
+            f"number of coefficients = {len(coeffs)}"
+        )
 
-    sum_point = coeffs[0] * points[0]
-    for (point, coeff) in zip(points[1:], coeffs[1:]):
-        sum_point = sum_point + coeff * point
+    # take the weighted sum of each dimension in one go, instead of building the scaled
+    # points and adding them together one at a time
+    columns = _stack_columns(points)
 
-    return sum_point
+    return CartesianND([sum(map(operator.mul, coeffs, column)) for column in columns])
 
 
 def centroid(points: Sequence[CartesianND]) -> CartesianND:
@@ -84,20 +117,80 @@ def centroid(points: Sequence[CartesianND]) -> CartesianND:
     n_points = len(points)
     assert n_points >= 1
 
-    sum_point = points[0]
-    for point in points[1:]:
-        sum_point += point
+    # sum each dimension in one go, instead of adding the points together one at a time
+    columns = _stack_columns(points)
+
+    return CartesianND([sum(column) / n_points for column in columns])
 
-    return sum_point / n_points
+
+def centroid_and_shift(
+    points: Sequence[CartesianND],
+    box: Optional[PeriodicBoxSidesND] = None,
+) -> tuple[CartesianND, list[CartesianND]]:
+    """
+    Calculate the centroid of the points, along with the points translated such that the
+    centroid lies at the origin. The coordinates are only collected once for both.
+
+    If 'box' is given, each translated point is also shifted by whole box side lengths
+    to lie within the sides of 'box' around the origin. The box must have the same number
+    of dimensions as the points.
+    """
+    n_points = len(points)
+    assert n_points >= 1
+
+    all_coords = _stack_coords(points)
+    centroid_coords = [sum(column) / n_points for column in zip(*all_coords)]
+
+    if box is None:
+        shifted_coords = [
+            [coord - centre for (coord, centre) in zip(coords, centroid_coords)]
+            for coords in all_coords
+        ]
+    else:
+        shifted_coords = _shift_coords_near(centroid_coords, all_coords, box)
+
+    shifted_points = [CartesianND(coords) for coords in shifted_coords]
+
+    return CartesianND(centroid_coords), shifted_points
 
 
 def relative_pair_distances(points: Sequence[CartesianND]) -> list[float]:
     """
     Calculate the distances between all pairs of points in free, non-periodic space.
 
+    The distances are ordered the same way as the pairs from `itertools.combinations`.
     If fewer than two points are present, the returned list is empty.
     """
-    return [euclidean_distance(p0, p1) for (p0, p1) in combinations(points, 2)]
+    # `math.dist` takes the distance of each pair in C, which is faster than building
+    # the squared distances one column at a time and then taking their square roots
+    return [
+        math.dist(coords0, coords1)
+        for (coords0, coords1) in combinations(_stack_coords(points), 2)
+    ]
+
+
+def relative_pair_distances_squared(points: Sequence[CartesianND]) -> list[float]:
+    """
+    Calculate the squared distances between all pairs of points in free, non-periodic
+    space. Callers that only compare distances (e.g. against a cutoff) can use this to
+    avoid taking a square root for every pair.
+
+    The distances are ordered the same way as the pairs from `itertools.combinations`.
+    If fewer than two points are present, the returned list is empty.
+    """
+    columns = _stack_columns(points)
+    n_points = len(points)
+
+    # accumulate the squared pair distances one dimension at a time, so the only scratch
+    # space needed is a single list of pair values, no matter the number of dimensions
+    distances_sq = [0.0] * (n_points * (n_points - 1) // 2)
+    for column in columns:
+        separations = [coord1 - coord0 for (coord0, coord1) in combinations(column, 2)]
+        distances_sq = [
+            dist_sq + sep * sep for (dist_sq, sep) in zip(distances_sq, separations)
+        ]
+
+    return distances_sq
 
 
 def periodic_relative_pair_distances(
@@ -106,11 +199,100 @@ def periodic_relative_pair_distances(
     """
     Calculate the distances between all pairs of points in periodic space.
 
+    The distances are ordered the same way as the pairs from `itertools.combinations`.
     If fewer than two points are present, the returned list is empty.
     """
-    return [
-        periodic_euclidean_distance(p0, p1, box) for (p0, p1) in combinations(points, 2)
-    ]
+    return list(map(math.sqrt, periodic_relative_pair_distances_squared(points, box)))
+
+
+def periodic_relative_pair_distances_squared(
+    points: Sequence[CartesianND], box: PeriodicBoxSidesND
+) -> list[float]:
+    """
+    Calculate the squared distances between all pairs of points in periodic space.
+    Callers that only compare distances (e.g. against a cutoff) can use this to avoid
+    taking a square root for every pair.
+
+    The distances are ordered the same way as the pairs from `itertools.combinations`.
+    If fewer than two points are present, the returned list is empty.
+    """
+    columns = _stack_columns(points)
+    n_points = len(points)
+
+    if n_points > 0 and len(columns) != box.n_dims:
+        err_msg = "The points and the box must have the same number of dimensions."
+        raise RuntimeError(err_msg)
+
+    distances_sq = [0.0] * (n_points * (n_points - 1) // 2)
+    for (column, sidelength, inv_sidelength) in zip(
+        columns, box._coords, box._inv_coords
+    ):
+        separations = [coord1 - coord0 for (coord0, coord1) in combinations(column, 2)]
+
+        # same minimum-image shift as `measure._periodic_min_image`, written out in place
+        # to avoid a Python function call for every pair
+        separations = [
+            sep - sidelength * math.floor(sep * inv_sidelength + 0.5)
+            for sep in separations
+        ]
+        distances_sq = [
+            dist_sq + sep * sep for (dist_sq, sep) in zip(distances_sq, separations)
+        ]
+
+    return distances_sq
+
+
+def distances_from(
+    reference: CartesianND, points: Sequence[CartesianND]
+) -> list[float]:
+    """
+    Calculate the distance between 'reference' and each of the points, in free,
+    non-periodic space. The distances are in the same order as the points.
+    """
+    ref_coords = reference._coords
+    columns = _stack_columns(points)
+    if len(points) > 0:
+        _check_same_n_dims(ref_coords, len(columns))
+
+    distances_sq = [0.0] * len(points)
+    for (column, ref_coord) in zip(columns, ref_coords):
+        separations = [coord - ref_coord for coord in column]
+        distances_sq = [
+            dist_sq + sep * sep for (dist_sq, sep) in zip(distances_sq, separations)
+        ]
+
+    return list(map(math.sqrt, distances_sq))
+
+
+def _stack_coords(points: Sequence[CartesianND]) -> list[tuple[float, ...]]:
+    """
+    Collect the coordinates of all the points into a single list, so the pair kernels
+    can index them directly instead of going through the points on every pair.
+    """
+    if isinstance(points, Cartesian3DArray):
+        return list(zip(*points.columns))
+
+    if not points:
+        return []
+
+    n_dims = points[0]._n_dims
+    all_coords = [point._coords for point in points]
+
+    if any([len(coords) != n_dims for coords in all_coords]):
+        raise ValueError("All the points must have the same dimensionality.")
+
+    return all_coords
+
+
+def _stack_columns(points: Sequence[CartesianND]) -> list[Sequence[float]]:
+    """
+    Collect the coordinates of all the points one dimension at a time. The columns of a
+    `Cartesian3DArray` are used as they are, without copying.
+    """
+    if isinstance(points, Cartesian3DArray):
+        return list(points.columns)
+
+    return list(zip(*_stack_coords(points)))
 
 
 # TODO: come up with a better description
@@ -126,63 +308,146 @@ def shift_points_together(
     if len(points) <= 1:
         return points
 
-    # pick a point and translate the entire system so that point is at the origin
-    point0 = points[0]
+    # pick a point and translate the entire system so that point is at the origin;
+    # then shift all other points to be inside the box around 'p0', all in one batch
+    all_coords = _stack_coords(points)
+    coords0 = all_coords[0]
+    shifted_coords = _shift_coords_near(coords0, all_coords[1:], box, err_if_too_far)
 
-    # shift all points to be inside the box around 'p0'
-    shifted_points = [CartesianND.origin(point0.n_dims)]
-    shifted_points.extend(
-        [
-            _translate_point_near_origin(p - point0, box, err_if_too_far)
-            for p in points[1:]
-        ]
-    )
+    shifted_points = [CartesianND.origin(len(coords0))]
+    shifted_points.extend([CartesianND(coords) for coords in shifted_coords])
 
     return shifted_points
 
 
-def _number_of_box_shifts(pair_separation: float, sidelength: float) -> int:
+def shift_all_near(
+    reference: CartesianND,
+    points: Sequence[CartesianND],
+    box: PeriodicBoxSidesND,
+    err_if_too_far: bool = False,
+) -> list[CartesianND]:
+    """
+    Shift each of the points by whole box side lengths, such that they lie within the
+    sides of 'box' around 'reference'.
+
+    'err_if_too_far'
+        - raise an exception if more than one shift has to be done to move any of the
+          points near 'reference'
+    """
+    ref_coords = reference._coords
+    shifted_coords = _shift_coords_near(
+        ref_coords, _stack_coords(points), box, err_if_too_far
+    )
+
+    return [
+        CartesianND(
+            [coord + ref_coord for (coord, ref_coord) in zip(coords, ref_coords)]
+        )
+        for coords in shifted_coords
+    ]
+
+
+def _shift_coords_near(
+    ref_coords: Sequence[float],
+    all_coords: Sequence[Sequence[float]],
+    box: PeriodicBoxSidesND,
+    err_if_too_far: bool = False,
+) -> list[list[float]]:
+    """
+    Calculate the coordinates of each point relative to 'ref_coords', shifted to lie
+    within the sides of 'box' around the origin.
+    """
+    if all_coords:
+        _check_same_n_dims(ref_coords, len(all_coords[0]))
+
+    if len(ref_coords) != box.n_dims:
+        err_msg = "The points and the box must have the same number of dimensions."
+        raise RuntimeError(err_msg)
+
+    relative_coords = [
+        [coord - ref_coord for (coord, ref_coord) in zip(coords, ref_coords)]
+        for coords in all_coords
+    ]
+
+    return _translate_points_near_origin(relative_coords, box, err_if_too_far)
+
+
+def _check_same_n_dims(ref_coords: Sequence[float], points_n_dims: int) -> None:
+    """Make sure the reference has the same dimensionality as the points."""
+    if len(ref_coords) != points_n_dims:
+        raise ValueError(
+            "The reference point must have the same dimensionality as the points.\n"
+            f"reference n_dims = {len(ref_coords)}\n"
+            f"points n_dims = {points_n_dims}"
+        )
+
+
+def _number_of_box_shifts(
+    pair_separation: float, sidelength: float, inv_sidelength: float
+) -> int:
     """
     Along a certain coordinate, calculate the numebr of times that a point would
     have to make jumps of length 'sidelength' to end up within a distance 'sidelength'
     of another point.
-    """
-    abs_pair_separation = abs(pair_separation)
 
-    if 2.0 * abs_pair_separation > sidelength:
-        sign = int(math.copysign(1, pair_separation))
-        n_shifts = math.ceil((abs_pair_separation / sidelength) - 0.5)
-        return sign * n_shifts
-    else:
-        return 0
+    'inv_sidelength' is the precomputed reciprocal of 'sidelength'.
 
+    This is the nearest whole number of sidelengths, so it needs neither a branch nor
+    the sign of the separation. A separation of exactly half a sidelength is shifted.
+    """
+    return math.floor(pair_separation * inv_sidelength + 0.5)
 
-def _translate_point_near_origin(
-    point: CartesianND,
+
+def _translate_points_near_origin(
+    all_coords: Sequence[Sequence[float]],
     box: PeriodicBoxSidesND,
     err_if_too_far: bool = False,
-) -> CartesianND:
+) -> list[list[float]]:
     """
-    Translate 'point' in space such that it lies within the sides of 'box' around
-    the origin.
+    Translate the coordinates of each point in space such that they lie within the
+    sides of 'box' around the origin.
+
+    When 'err_if_too_far' is set, every coordinate of every point is checked first, and
+    the shifted coordinates are only built once they are all known to be valid. A
+    coordinate is too far if it lies more than one and a half side lengths from the
+    origin, in either direction.
 
     'err_if_too_far'
-        - raise an exception if more than one shift has to be done to move the point
-          near the origin
-    """
-
-    new_coords = array.array("d", [0] * point.n_dims)
-    for i_coord, (coord, sidelen) in enumerate(zip(point.coordinates, box.coordinates)):
-        n_shifts = _number_of_box_shifts(coord, sidelen)
-        if err_if_too_far and abs(n_shifts) > 1:
-            raise RuntimeError(
-                "The point is too far from the origin relative to the size of the box.\n"
-                "More than a single shift had to be performed.\n"
-                f"point: {point}\n"
-                f"box: {box}\n"
-                f"number of shifts along coordinate {i_coord}: {n_shifts}\n"
+        - raise an exception if more than one shift has to be done to move any of the
+          points near the origin
+    """
+    sidelengths = box._coords
+    inv_sidelengths = box._inv_coords
+
+    if err_if_too_far:
+        for coords in all_coords:
+            for (i_coord, (coord, inv_sidelen)) in enumerate(
+                zip(coords, inv_sidelengths)
+            ):
+                # checked on the magnitude, so that coordinates of exactly +1.5 and
+                # -1.5 side lengths are both accepted; `_number_of_box_shifts` rounds
+                # half-way values up, and would count 2 shifts for +1.5 but -1 for -1.5
+                if abs(coord * inv_sidelen) > 1.5:
+                    n_shifts = _number_of_box_shifts(
+                        coord, sidelengths[i_coord], inv_sidelen
+                    )
+                    point = CartesianND(coords)
+                    raise RuntimeError(
+                        "The point is too far from the origin relative to the size of the box.\n"
+                        "More than a single shift had to be performed.\n"
+                        f"point: {point}\n"
+                        f"box: {box}\n"
+                        f"number of shifts along coordinate {i_coord}: {n_shifts}\n"
+                    )
+
+    # apply the minimum-image shift from `_number_of_box_shifts` directly to every
+    # coordinate
+    return [
+        [
+            coord - sidelen * math.floor(coord * inv_sidelen + 0.5)
+            for (coord, sidelen, inv_sidelen) in zip(
+                coords, sidelengths, inv_sidelengths
             )
-
-        new_coords[i_coord] = coord - n_shifts * sidelen
-
-    return CartesianND(new_coords)
+        ]
+        for coords in all_coords
+    ]
@@ -1,37 +1,56 @@
 from __future__ import annotations
 
-from abc import ABC
-from array import array
+from typing import Sequence
 
+from .point import _as_float
 
-class PeriodicBoxSidesND(ABC):
+
+class PeriodicBoxSidesND:
     """Describe the side lengths of a box in N-dimensional cartesian space."""
 
-    _coords: array[float]
+    __slots__ = ("_coords", "_inv_coords")
+
+    _coords: tuple[float, ...]
+    _inv_coords: tuple[float, ...]
 
-    def __init__(self, coords: array[float]) -> None:
-        self._coords = coords
+    def __init__(self, coords: Sequence[float]) -> None:
+        # the side lengths are stored as a plain tuple; the periodic kernels in `measure`
+        # and `operations` read `_coords` and `_inv_coords` directly
+        self._coords = tuple([_as_float(coord) for coord in coords])
 
-        if any([coord <= 0.0 for coord in self._coords]):
+        if any(coord <= 0.0 for coord in self._coords):
             err_msg = (
                 "All side lengths in the periodic box must be positive.\n"
                 f"Found: {self.__repr__()}"
             )
             raise ValueError(err_msg)
 
+        # the periodic kernels multiply by the reciprocal instead of dividing by the side
+        # lengths, so they are calculated once here
+        self._inv_coords = tuple([1.0 / coord for coord in self._coords])
+
     @property
-    def coordinates(self) -> array[float]:
+    def coordinates(self) -> tuple[float, ...]:
         """Direct access to coordinates, mainly for iteration."""
         return self._coords
 
+    @property
+    def inv_coordinates(self) -> tuple[float, ...]:
+        """The reciprocals of the side lengths, precomputed when the box is created."""
+        return self._inv_coords
+
     @property
     def n_dims(self) -> int:
         return len(self._coords)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, PeriodicBoxSidesND):
-            return NotImplemented
-        return self._coords == other.coordinates
+        if isinstance(other, PeriodicBoxSidesND):
+            return self._coords == other._coords
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash of the side lengths of the box, as a tuple."""
+        return hash(self._coords)
 
     def __getitem__(self, i_dim: int) -> float:
         """Return the value of the `dim`th dimension of this box."""
@@ -46,19 +65,25 @@ class PeriodicBoxSidesND(ABC):
 class PeriodicBoxSides1D(PeriodicBoxSidesND):
     """Represents the sides of a periodic box in 1D cartesian space."""
 
+    __slots__ = ()
+
     def __init__(self, xlen: float) -> None:
-        super().__init__(array("d", [xlen]))
+        super().__init__((xlen,))
 
 
 class PeriodicBoxSides2D(PeriodicBoxSidesND):
     """Represents the sides of a periodic box in 2D cartesian space."""
 
+    __slots__ = ()
+
     def __init__(self, xlen: float, ylen: float) -> None:
-        super().__init__(array("d", [xlen, ylen]))
+        super().__init__((xlen, ylen))
 
 
 class PeriodicBoxSides3D(PeriodicBoxSidesND):
     """Represents the sides of a periodic box in 3D cartesian space."""
 
+    __slots__ = ()
+
     def __init__(self, xlen: float, ylen: float, zlen: float) -> None:
-        super().__init__(array("d", [xlen, ylen, zlen]))
+        super().__init__((xlen, ylen, zlen))
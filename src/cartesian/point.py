@@ -1,39 +1,78 @@
 """
-This module contains the abstract class CartesianND, as well as the concrete
+This module contains the base class CartesianND, as well as the concrete
 classes Cartesian1D, Cartesian2D, and Cartesian3D, for expressing points
 in continuous cartesian space of their corresponding dimensions.
 """
 
 from __future__ import annotations
 
-from abc import ABC
-from array import array
+import operator
+from numbers import Real
+from typing import Sequence
 
+# the operators of the concrete classes create their results without going through
+# `__init__()`; the scalar operand is checked to be a real number first, so the new
+# coordinates are already floats
+_new_point = object.__new__
 
-class CartesianND(ABC):
+# the most common scalar types, which skip the slower `_is_real()` check
+_FAST_SCALAR_TYPES = (float, int)
+
+# the points are immutable, so each origin is only created once and then shared
+_ND_ORIGINS: dict[int, CartesianND] = {}
+
+
+def _as_float(value: object) -> float:
+    """
+    Convert a coordinate to a float. Like `array("d", ...)`, and unlike `float()`, this
+    rejects strings instead of parsing them.
+
+    The constructors only call this for coordinates that aren't already floats.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        raise TypeError(f"must be real number, not {type(value).__name__}")
+    return float(value)  # type: ignore[arg-type]
+
+
+def _is_real(value: object) -> bool:
+    """Check if a scalar operand is a real number, and not e.g. a complex number or a point."""
+    return isinstance(value, Real)
+
+
+class CartesianND:
     """Defines the interface for concrete Cartesian classes."""
 
-    _coords: array[float]
+    __slots__ = ("_coords", "_n_dims")
 
-    def __init__(self, coords: array[float]) -> None:
-        self._coords = coords
+    # the coordinates are stored as a plain tuple, and the number of dimensions is
+    # stored alongside them; the functions in `measure` and `operations` read `_coords`
+    # and `_n_dims` directly on their hot paths
+    _coords: tuple[float, ...]
+    _n_dims: int
+
+    def __init__(self, coords: Sequence[float]) -> None:
+        self._coords = tuple(
+            [coord if type(coord) is float else _as_float(coord) for coord in coords]
+        )
+        self._n_dims = len(self._coords)
 
     @property
-    def coordinates(self) -> array[float]:
+    def coordinates(self) -> tuple[float, ...]:
         """Direct access to coordinates, mainly for iteration."""
         return self._coords
 
     @property
     def n_dims(self) -> int:
-        return len(self._coords)
+        return self._n_dims
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, CartesianND):
-            return NotImplemented
-        return self._coords == other.coordinates
+        if isinstance(other, CartesianND):
+            return self._coords == other._coords
+        return NotImplemented
 
-    def __hash__(self):
-        return hash(tuple(self._coords))
+    def __hash__(self) -> int:
+        """Hash of the coordinates of the point, as a tuple."""
+        return hash(self._coords)
 
     def __getitem__(self, i_dim: int) -> float:
         """Return the value of the `dim`th dimension of this point."""
@@ -46,87 +85,282 @@ class CartesianND(ABC):
 
     def __add__(self, other: CartesianND) -> CartesianND:
         """Element-wise addition of two points in cartesian space."""
-        if self.n_dims != other.n_dims:
+        if self._n_dims != other._n_dims:
             return NotImplemented
 
-        new_coords = [
-            co_self + co_other
-            for (co_self, co_other) in zip(self._coords, other.coordinates)
-        ]
+        new_coords = tuple(map(operator.add, self._coords, other._coords))
 
-        return CartesianND(array("d", new_coords))
+        return CartesianND(new_coords)
 
     def __sub__(self, other: CartesianND) -> CartesianND:
         """Element-wise subtraction of two points in cartesian space."""
-        if self.n_dims != other.n_dims:
+        if self._n_dims != other._n_dims:
             return NotImplemented
 
-        new_coords = [
-            co_self - co_other
-            for (co_self, co_other) in zip(self._coords, other.coordinates)
-        ]
+        new_coords = tuple(map(operator.sub, self._coords, other._coords))
 
-        return CartesianND(array("d", new_coords))
+        return CartesianND(new_coords)
 
     def __mul__(self, other: float) -> CartesianND:
         """Scalar multiplication of the point in cartesian space by a number."""
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
         new_coords = [other * coord for coord in self._coords]
 
-        return CartesianND(array("d", new_coords))
+        return CartesianND(new_coords)
 
     def __rmul__(self, other: float) -> CartesianND:
         """Scalar multiplication of the point in cartesian space by a number."""
         return self.__mul__(other)
 
     def __floordiv__(self, other: float) -> CartesianND:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
         if other == 0.0:
             raise ZeroDivisionError("cannot divide Cartesian1D coordinates by 0")
         else:
             new_coords = [coord // other for coord in self._coords]
-            return CartesianND(array("d", new_coords))
+            return CartesianND(new_coords)
 
     def __truediv__(self, other: float) -> CartesianND:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
         if other == 0.0:
             raise ZeroDivisionError("cannot divide Cartesian1D coordinates by 0")
         else:
             new_coords = [coord / other for coord in self._coords]
-            return CartesianND(array("d", new_coords))
+            return CartesianND(new_coords)
 
     @classmethod
     def origin(self, size: int) -> CartesianND:
         if size <= 0:
             raise ValueError("CartesianND point must have a `size` of 1 or greater.")
-        return CartesianND(array("d", [0.0] * size))
+
+        origin = _ND_ORIGINS.get(size)
+        if origin is None:
+            origin = CartesianND([0.0] * size)
+            _ND_ORIGINS[size] = origin
+
+        return origin
 
 
 class Cartesian1D(CartesianND):
     """Represents a point in 1D cartesian space."""
 
+    __slots__ = ()
+
     def __init__(self, x: float) -> None:
-        self._coords = array("d", [x])
+        self._coords = (x if type(x) is float else _as_float(x),)
+        self._n_dims = 1
+
+    def __add__(self, other: CartesianND) -> Cartesian1D:
+        """Element-wise addition of two points in cartesian space."""
+        if other._n_dims != 1:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new_point(Cartesian1D)
+        point._coords = (a[0] + b[0],)
+        point._n_dims = 1
+        return point
+
+    def __sub__(self, other: CartesianND) -> Cartesian1D:
+        """Element-wise subtraction of two points in cartesian space."""
+        if other._n_dims != 1:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new_point(Cartesian1D)
+        point._coords = (a[0] - b[0],)
+        point._n_dims = 1
+        return point
+
+    def __mul__(self, other: float) -> Cartesian1D:
+        """Scalar multiplication of the point in cartesian space by a number."""
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        a = self._coords
+        point = _new_point(Cartesian1D)
+        point._coords = (other * a[0],)
+        point._n_dims = 1
+        return point
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other: float) -> Cartesian1D:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide Cartesian1D coordinates by 0")
+        a = self._coords
+        point = _new_point(Cartesian1D)
+        point._coords = (a[0] // other,)
+        point._n_dims = 1
+        return point
+
+    def __truediv__(self, other: float) -> Cartesian1D:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide Cartesian1D coordinates by 0")
+        a = self._coords
+        point = _new_point(Cartesian1D)
+        point._coords = (a[0] / other,)
+        point._n_dims = 1
+        return point
 
     @classmethod
     def origin(self) -> Cartesian1D:
-        return Cartesian1D(0.0)
+        return _ORIGIN_1D
 
 
 class Cartesian2D(CartesianND):
     """Represents a point in 2D cartesian space."""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float) -> None:
-        self._coords = array("d", [x, y])
+        self._coords = (
+            x if type(x) is float else _as_float(x),
+            y if type(y) is float else _as_float(y),
+        )
+        self._n_dims = 2
+
+    def __add__(self, other: CartesianND) -> Cartesian2D:
+        """Element-wise addition of two points in cartesian space."""
+        if other._n_dims != 2:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new_point(Cartesian2D)
+        point._coords = (a[0] + b[0], a[1] + b[1])
+        point._n_dims = 2
+        return point
+
+    def __sub__(self, other: CartesianND) -> Cartesian2D:
+        """Element-wise subtraction of two points in cartesian space."""
+        if other._n_dims != 2:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new_point(Cartesian2D)
+        point._coords = (a[0] - b[0], a[1] - b[1])
+        point._n_dims = 2
+        return point
+
+    def __mul__(self, other: float) -> Cartesian2D:
+        """Scalar multiplication of the point in cartesian space by a number."""
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        a = self._coords
+        point = _new_point(Cartesian2D)
+        point._coords = (other * a[0], other * a[1])
+        point._n_dims = 2
+        return point
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other: float) -> Cartesian2D:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide Cartesian2D coordinates by 0")
+        a = self._coords
+        point = _new_point(Cartesian2D)
+        point._coords = (a[0] // other, a[1] // other)
+        point._n_dims = 2
+        return point
+
+    def __truediv__(self, other: float) -> Cartesian2D:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide Cartesian2D coordinates by 0")
+        a = self._coords
+        point = _new_point(Cartesian2D)
+        point._coords = (a[0] / other, a[1] / other)
+        point._n_dims = 2
+        return point
 
     @classmethod
     def origin(self) -> Cartesian2D:
-        return Cartesian2D(0.0, 0.0)
+        return _ORIGIN_2D
 
 
 class Cartesian3D(CartesianND):
     """Represents a point in 3D cartesian space."""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, z: float) -> None:
-        self._coords = array("d", [x, y, z])
+        self._coords = (
+            x if type(x) is float else _as_float(x),
+            y if type(y) is float else _as_float(y),
+            z if type(z) is float else _as_float(z),
+        )
+        self._n_dims = 3
+
+    def __add__(self, other: CartesianND) -> Cartesian3D:
+        """Element-wise addition of two points in cartesian space."""
+        if other._n_dims != 3:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new_point(Cartesian3D)
+        point._coords = (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+        point._n_dims = 3
+        return point
+
+    def __sub__(self, other: CartesianND) -> Cartesian3D:
+        """Element-wise subtraction of two points in cartesian space."""
+        if other._n_dims != 3:
+            return NotImplemented
+        a = self._coords
+        b = other._coords
+        point = _new_point(Cartesian3D)
+        point._coords = (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+        point._n_dims = 3
+        return point
+
+    def __mul__(self, other: float) -> Cartesian3D:
+        """Scalar multiplication of the point in cartesian space by a number."""
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        a = self._coords
+        point = _new_point(Cartesian3D)
+        point._coords = (other * a[0], other * a[1], other * a[2])
+        point._n_dims = 3
+        return point
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other: float) -> Cartesian3D:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide Cartesian3D coordinates by 0")
+        a = self._coords
+        point = _new_point(Cartesian3D)
+        point._coords = (a[0] // other, a[1] // other, a[2] // other)
+        point._n_dims = 3
+        return point
+
+    def __truediv__(self, other: float) -> Cartesian3D:
+        if type(other) not in _FAST_SCALAR_TYPES and not _is_real(other):
+            return NotImplemented
+        if other == 0.0:
+            raise ZeroDivisionError("cannot divide Cartesian3D coordinates by 0")
+        a = self._coords
+        point = _new_point(Cartesian3D)
+        point._coords = (a[0] / other, a[1] / other, a[2] / other)
+        point._n_dims = 3
+        return point
 
     @classmethod
     def origin(self) -> Cartesian3D:
-        return Cartesian3D(0.0, 0.0, 0.0)
+        return _ORIGIN_3D
+
+
+_ORIGIN_1D = Cartesian1D(0.0)
+_ORIGIN_2D = Cartesian2D(0.0, 0.0)
+_ORIGIN_3D = Cartesian3D(0.0, 0.0, 0.0)
@@ -0,0 +1,106 @@
+"""
+This module contains the Cartesian3DArray class, a container for many points in
+continuous 3D cartesian space.
+
+The container stores each coordinate in its own contiguous column, instead of one
+small object per point. Functions in `operations` that work on many points at once
+consume the columns directly, so the coordinates don't have to be collected again
+on every call.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import Iterable
+from typing import overload
+
+from .point import Cartesian3D
+from .point import CartesianND
+
+
+class Cartesian3DArray(Sequence[Cartesian3D]):
+    """Represents a collection of points in 3D cartesian space, stored column by column."""
+
+    __slots__ = ("_columns",)
+
+    _columns: tuple[array[float], array[float], array[float]]
+
+    def __init__(
+        self, xs: Iterable[float], ys: Iterable[float], zs: Iterable[float]
+    ) -> None:
+        self._columns = (array("d", xs), array("d", ys), array("d", zs))
+
+        if not len(self._columns[0]) == len(self._columns[1]) == len(self._columns[2]):
+            raise ValueError(
+                "All the coordinate columns must have the same length.\n"
+                f"len(xs) = {len(self._columns[0])}\n"
+                f"len(ys) = {len(self._columns[1])}\n"
+                f"len(zs) = {len(self._columns[2])}"
+            )
+
+    @classmethod
+    def from_points(cls, points: Iterable[CartesianND]) -> Cartesian3DArray:
+        """Create the container from the coordinates of 3-dimensional points."""
+        all_coords = [point.coordinates for point in points]
+
+        if any([len(coords) != 3 for coords in all_coords]):
+            raise ValueError("All the points must be 3-dimensional.")
+
+        xs = [coords[0] for coords in all_coords]
+        ys = [coords[1] for coords in all_coords]
+        zs = [coords[2] for coords in all_coords]
+
+        return cls(xs, ys, zs)
+
+    @classmethod
+    def zeros(cls, n_points: int) -> Cartesian3DArray:
+        """Create a container of `n_points` points, all at the origin."""
+        if n_points < 0:
+            raise ValueError("Cartesian3DArray must have a `n_points` of 0 or greater.")
+
+        zeros = [0.0] * n_points
+        return cls(zeros, zeros, zeros)
+
+    @property
+    def columns(self) -> tuple[array[float], array[float], array[float]]:
+        """Direct access to the x, y, and z coordinate columns."""
+        return self._columns
+
+    @property
+    def n_dims(self) -> int:
+        return 3
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    @overload
+    def __getitem__(self, index: int) -> Cartesian3D:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Cartesian3DArray:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Cartesian3D | Cartesian3DArray:
+        """Return the `index`th point, or a new container for a slice of the points."""
+        xs, ys, zs = self._columns
+        if isinstance(index, slice):
+            return Cartesian3DArray(xs[index], ys[index], zs[index])
+
+        return Cartesian3D(xs[index], ys[index], zs[index])
+
+    def __setitem__(self, index: int, point: CartesianND) -> None:
+        """Overwrite the coordinates of the `index`th point."""
+        if point.n_dims != 3:
+            raise ValueError(
+                "Only 3-dimensional points can be stored in a Cartesian3DArray.\n"
+                f"point.n_dims = {point.n_dims}"
+            )
+
+        xs, ys, zs = self._columns
+        xs[index], ys[index], zs[index] = point.coordinates
+
+    def __repr__(self) -> str:
+        """Printed representation of the container as a list of points."""
+        return "Cartesian3DArray([" + ", ".join([repr(point) for point in self]) + "])"
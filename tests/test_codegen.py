@@ -0,0 +1,122 @@
+import pickle
+
+import pytest
+
+from cartesian import Cartesian1D
+from cartesian import Cartesian2D
+from cartesian import Cartesian3D
+from cartesian import CartesianND
+from cartesian import make_cartesian
+
+
+def test_same_class_each_call():
+    assert make_cartesian(5) is make_cartesian(5)
+
+
+@pytest.mark.parametrize(
+    "n_dims, cartesian_class", [(1, Cartesian1D), (2, Cartesian2D), (3, Cartesian3D)]
+)
+def test_existing_classes(n_dims, cartesian_class):
+    assert make_cartesian(n_dims) is cartesian_class
+
+
+def test_pickle():
+    Cartesian5D = make_cartesian(5)
+    point = Cartesian5D(1, 2, 3, 4, 5)
+
+    unpickled = pickle.loads(pickle.dumps(point))
+
+    assert type(unpickled) is Cartesian5D
+    assert unpickled == point
+
+
+@pytest.mark.parametrize("n_dims", [0, -1])
+def test_raises_invalid_n_dims(n_dims):
+    with pytest.raises(ValueError):
+        make_cartesian(n_dims)
+
+
+def test_class_name_and_base():
+    cartesian_class = make_cartesian(4)
+    assert cartesian_class.__name__ == "Cartesian4D"
+    assert issubclass(cartesian_class, CartesianND)
+
+
+def test_construction():
+    Cartesian4D = make_cartesian(4)
+    point = Cartesian4D(1, 2, 3, 4)
+
+    assert point.coordinates == (1.0, 2.0, 3.0, 4.0)
+    assert point.n_dims == 4
+    assert point == CartesianND([1.0, 2.0, 3.0, 4.0])
+
+
+def test_single_dimension():
+    Cartesian1 = make_cartesian(1)
+    point = Cartesian1(2.0) + Cartesian1(3.0)
+
+    assert point.coordinates == (5.0,)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda p0, p1: p0 + p1,
+        lambda p0, p1: p0 - p1,
+        lambda p0, p1: p0 * 2.5,
+        lambda p0, p1: 2.5 * p0,
+        lambda p0, p1: p0 / 2.5,
+        lambda p0, p1: p0 // 2.5,
+    ],
+)
+def test_operators_match_cartesian_nd(operation):
+    Cartesian6D = make_cartesian(6)
+    coords0 = [1.0, -2.0, 3.5, 4.0, -5.25, 6.0]
+    coords1 = [0.5, 1.5, -2.5, 3.5, 4.5, -5.5]
+
+    expected = operation(CartesianND(coords0), CartesianND(coords1))
+    actual = operation(Cartesian6D(*coords0), Cartesian6D(*coords1))
+
+    assert type(actual) is Cartesian6D
+    assert actual == expected
+
+
+def test_add_mismatched_dims():
+    Cartesian4D = make_cartesian(4)
+    with pytest.raises(TypeError):
+        Cartesian4D(1, 2, 3, 4) + CartesianND([1.0, 2.0])
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda p, other: p * other,
+        lambda p, other: other * p,
+        lambda p, other: p / other,
+        lambda p, other: p // other,
+    ],
+)
+@pytest.mark.parametrize("other_kind", ["point", "complex"])
+def test_non_real_scalar_raises(operation, other_kind):
+    Cartesian4D = make_cartesian(4)
+    point = Cartesian4D(1, 2, 3, 4)
+    other = point if other_kind == "point" else 2j
+
+    with pytest.raises(TypeError):
+        operation(point, other)
+
+
+@pytest.mark.parametrize("operation", [lambda p: p / 0.0, lambda p: p // 0.0])
+def test_divide_by_zero(operation):
+    Cartesian4D = make_cartesian(4)
+    with pytest.raises(ZeroDivisionError):
+        operation(Cartesian4D(1, 2, 3, 4))
+
+
+def test_origin():
+    Cartesian4D = make_cartesian(4)
+    origin = Cartesian4D.origin()
+
+    assert type(origin) is Cartesian4D
+    assert origin == CartesianND.origin(4)
+    assert origin is Cartesian4D.origin()
@@ -1,10 +1,12 @@
 import math
+from array import array
 
 import pytest
 
 from cartesian import Cartesian1D
 from cartesian import Cartesian2D
 from cartesian import Cartesian3D
+from cartesian import CartesianND
 from cartesian import measure
 from cartesian import PeriodicBoxSides1D
 from cartesian import PeriodicBoxSides2D
@@ -17,6 +19,11 @@ from cartesian import PeriodicBoxSides3D
         (Cartesian1D(-1.0), Cartesian1D(1.0), 2.0),
         (Cartesian2D(-1.0, -1.0), Cartesian2D(1.0, 1.0), (8.0) ** 0.5),
         (Cartesian3D(-1.0, -1.0, -1.0), Cartesian3D(1.0, 1.0, 1.0), (12.0) ** 0.5),
+        (
+            CartesianND(array("d", [-1.0, -1.0, -1.0, -1.0])),
+            CartesianND(array("d", [1.0, 1.0, 1.0, 1.0])),
+            4.0,
+        ),
     ],
 )
 def test_euclidean_distance(point0, point1, distance):
@@ -58,10 +65,12 @@ def test_euclidean_distance_squared():
         (Cartesian1D(1.0), 1.0),
         (Cartesian2D(1.0, 1.0), (2.0) ** 0.5),
         (Cartesian3D(1.0, 1.0, 1.0), (3.0) ** 0.5),
+        (CartesianND(array("d", [1.0, 1.0, 1.0, 1.0])), 2.0),
     ],
 )
 def test_euclidean_norm(point, norm):
     assert measure.euclidean_norm(point) == pytest.approx(norm)
+    assert measure.euclidean_norm_squared(point) == pytest.approx(norm**2)
 
 
 def test_euclidean_norm_squared():
@@ -108,6 +117,14 @@ def test__periodic_modulus_pairdist_sidelength1(pair_sep, actual_true_pair_sep):
     )
 
 
+@pytest.mark.parametrize("pair_sep", [0.5, -0.5, 1.5, -1.5, 2.5, -2.5])
+def test__periodic_modulus_pairdist_half_sidelength(pair_sep):
+    sidelength = 1.0
+
+    true_pair_sep = measure._periodic_modulus_pairdist(pair_sep, sidelength)
+    assert abs(true_pair_sep) == pytest.approx(0.5 * sidelength)
+
+
 @pytest.mark.parametrize(
     "point0, point1, box, expect_distance",
     [
@@ -204,6 +221,29 @@ def test_periodic_euclidean_norm_wrong_boxdimension():
         measure.periodic_euclidean_norm_squared(point, box)
 
 
+def test_distance_and_norms():
+    point0 = Cartesian3D(1.0, 2.0, 3.0)
+    point1 = Cartesian3D(-4.0, 0.5, 2.0)
+
+    distance, norm0, norm1 = measure.distance_and_norms(point0, point1)
+
+    # fmt: off
+    assert (
+        distance == pytest.approx(measure.euclidean_distance(point0, point1))
+        and norm0 == pytest.approx(measure.euclidean_norm(point0))
+        and norm1 == pytest.approx(measure.euclidean_norm(point1))
+    )
+    # fmt: on
+
+
+def test_distance_and_norms_raises_different_sizes():
+    p_dim1 = Cartesian1D(2.0)
+    p_dim2 = Cartesian2D(3.0, -1.0)
+
+    with pytest.raises(ValueError):
+        measure.distance_and_norms(p_dim1, p_dim2)
+
+
 def test_approx_eq():
     x = 1.0
     y = 2.0
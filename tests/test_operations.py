@@ -1,7 +1,11 @@
+import itertools
+from array import array
+
 import pytest
 
 from cartesian import Cartesian2D
 from cartesian import Cartesian3D
+from cartesian import CartesianND
 from cartesian import measure
 from cartesian import operations
 from cartesian import PeriodicBoxSides2D
@@ -68,6 +72,57 @@ class TestCentroid:
         centroid_point = operations.centroid(points)
         assert measure.approx_eq(centroid_point, expect_point)
 
+    def test_single_point(self):
+        points = [Cartesian2D(1.5, -2.5)]
+
+        centroid_point = operations.centroid(points)
+        assert measure.approx_eq(centroid_point, points[0])
+
+    def test_empty(self):
+        with pytest.raises(AssertionError):
+            operations.centroid([])
+
+
+class Test_centroid_and_shift:
+    def test_basic_functionality(self):
+        points = [
+            Cartesian2D(1.0, 2.0),
+            Cartesian2D(3.0, 2.0),
+            Cartesian2D(2.0, 5.0),
+        ]
+
+        centroid_point, shifted_points = operations.centroid_and_shift(points)
+
+        assert measure.approx_eq(centroid_point, operations.centroid(points))
+        for (shifted, point) in zip(shifted_points, points):
+            assert measure.approx_eq(shifted, point - centroid_point)
+
+    def test_periodic(self):
+        points = [
+            Cartesian2D(0.1, 0.1),
+            Cartesian2D(0.9, 0.1),
+            Cartesian2D(0.5, 1.0),
+        ]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        centroid_point, shifted_points = operations.centroid_and_shift(points, box)
+
+        assert measure.approx_eq(centroid_point, Cartesian2D(0.5, 0.4))
+        assert measure.approx_eq(shifted_points[0], Cartesian2D(-0.4, -0.3))
+        assert measure.approx_eq(shifted_points[1], Cartesian2D(0.4, -0.3))
+        assert measure.approx_eq(shifted_points[2], Cartesian2D(0.0, -0.4))
+
+    def test_raises_wrong_boxdimension(self):
+        points = [Cartesian3D(0.1, 0.2, 0.3), Cartesian3D(0.9, 0.8, 0.7)]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        with pytest.raises(RuntimeError):
+            operations.centroid_and_shift(points, box)
+
+    def test_empty(self):
+        with pytest.raises(AssertionError):
+            operations.centroid_and_shift([])
+
 
 class Test_dot_product:
     def test_basic_functionality(self):
@@ -76,6 +131,22 @@ class Test_dot_product:
 
         assert operations.dot_product(p0, p1) == pytest.approx(2.0)
 
+    @pytest.mark.parametrize(
+        "coords0, coords1",
+        [
+            ((1.0,), (-2.0,)),
+            ((1.0, 2.0), (3.0, -4.0)),
+            ((1.0, 2.0, 3.0), (4.0, 5.0, 6.0)),
+            ((1.0, 2.0, 3.0, 4.0), (-5.0, 6.0, -7.0, 8.0)),
+        ],
+    )
+    def test_matches_brute_force(self, coords0, coords1):
+        p0 = CartesianND(array("d", coords0))
+        p1 = CartesianND(array("d", coords1))
+
+        expected = sum([c0 * c1 for (c0, c1) in zip(coords0, coords1)])
+        assert operations.dot_product(p0, p1) == pytest.approx(expected)
+
     def test_raises_different_sizes(self):
         p_dim2 = Cartesian2D(1.0, 2.0)
         p_dim3 = Cartesian3D(3.0, 4.0, 5.0)
@@ -105,6 +176,22 @@ class Test_shift_points_together:
         assert measure.approx_eq(shifted_points[1], Cartesian2D(0.4, 0.0))
         assert measure.approx_eq(shifted_points[2], Cartesian2D(0.4, -0.2))
 
+    def test_same_with_check(self):
+        points = [
+            Cartesian2D(0.1, 0.1),
+            Cartesian2D(0.5, 0.1),
+            Cartesian2D(0.5, 0.9),
+            Cartesian2D(-0.3, 1.05),
+        ]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        shifted_points = operations.shift_points_together(points, box)
+        checked_points = operations.shift_points_together(
+            points, box, err_if_too_far=True
+        )
+
+        assert shifted_points == checked_points
+
     def test_0_points(self):
         box = PeriodicBoxSides2D(1.0, 1.0)
         points = []
@@ -135,6 +222,79 @@ class Test_shift_points_together:
         )
 
 
+class Test_shift_all_near:
+    def test_basic_functionality(self):
+        reference = Cartesian2D(0.1, 0.1)
+        points = [
+            Cartesian2D(0.5, 0.1),
+            Cartesian2D(0.5, 0.9),
+            Cartesian2D(-0.7, 2.05),
+        ]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        shifted_points = operations.shift_all_near(reference, points, box)
+
+        assert measure.approx_eq(shifted_points[0], Cartesian2D(0.5, 0.1))
+        assert measure.approx_eq(shifted_points[1], Cartesian2D(0.5, -0.1))
+        assert measure.approx_eq(shifted_points[2], Cartesian2D(0.3, 0.05))
+
+    def test_raises_too_far(self):
+        reference = Cartesian2D(0.1, 0.1)
+        points = [Cartesian2D(0.5, 1.9)]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        with pytest.raises(RuntimeError):
+            operations.shift_all_near(reference, points, box, err_if_too_far=True)
+
+    @pytest.mark.parametrize("y_coord", [1.5, -1.5])
+    def test_too_far_boundary_accepted(self, y_coord):
+        reference = Cartesian2D(0.0, 0.0)
+        points = [Cartesian2D(0.0, y_coord)]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        operations.shift_all_near(reference, points, box, err_if_too_far=True)
+
+    @pytest.mark.parametrize("y_coord", [1.6, -1.6])
+    def test_too_far_boundary_raises(self, y_coord):
+        reference = Cartesian2D(0.0, 0.0)
+        points = [Cartesian2D(0.0, y_coord)]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        with pytest.raises(RuntimeError):
+            operations.shift_all_near(reference, points, box, err_if_too_far=True)
+
+    def test_raises_wrong_boxdimension(self):
+        reference = Cartesian3D(0.0, 0.0, 0.0)
+        points = [Cartesian3D(0.9, 0.9, 0.9)]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        with pytest.raises(RuntimeError):
+            operations.shift_all_near(reference, points, box)
+
+
+class Test_distances_from:
+    def test_basic_functionality(self):
+        reference = Cartesian2D(1.0, 1.0)
+        points = [
+            Cartesian2D(1.0, 1.0),
+            Cartesian2D(4.0, 5.0),
+            Cartesian2D(1.0, -1.0),
+        ]
+
+        distances = operations.distances_from(reference, points)
+        assert distances == pytest.approx([0.0, 5.0, 2.0])
+
+    def test_no_points(self):
+        assert operations.distances_from(Cartesian2D(1.0, 1.0), []) == []
+
+    def test_raises_different_sizes(self):
+        reference = Cartesian2D(1.0, 1.0)
+        points = [Cartesian3D(1.0, 2.0, 3.0)]
+
+        with pytest.raises(ValueError):
+            operations.distances_from(reference, points)
+
+
 class Test_relative_pair_distances:
     def test_basic_functionality(self):
         points = [
@@ -157,6 +317,83 @@ class Test_relative_pair_distances:
     def test_no_points(self):
         assert operations.relative_pair_distances([]) == []
 
+    def test_matches_pairwise_distance(self):
+        points = [
+            Cartesian3D(0.1, 0.2, 0.3),
+            Cartesian3D(-1.0, 2.5, 0.0),
+            Cartesian3D(4.0, -3.0, 1.5),
+            Cartesian3D(0.7, 0.7, -0.7),
+        ]
+
+        pair_distances = operations.relative_pair_distances(points)
+        expected = [
+            measure.euclidean_distance(p0, p1)
+            for (p0, p1) in itertools.combinations(points, 2)
+        ]
+
+        assert pair_distances == pytest.approx(expected)
+
+    def test_squared(self):
+        points = [
+            Cartesian2D(0.0, 0.0),
+            Cartesian2D(3.0, 4.0),
+            Cartesian2D(-1.0, 1.0),
+        ]
+
+        pair_distances = operations.relative_pair_distances(points)
+        pair_distances_sq = operations.relative_pair_distances_squared(points)
+
+        assert pair_distances_sq == pytest.approx([25.0, 2.0, 25.0])
+        assert pair_distances_sq == pytest.approx([d**2 for d in pair_distances])
+
+    def test_raises_different_sizes(self):
+        points = [Cartesian2D(0.0, 0.0), Cartesian3D(1.0, 2.0, 3.0)]
+
+        with pytest.raises(ValueError):
+            operations.relative_pair_distances(points)
+
+
+class Test_periodic_relative_pair_distances:
+    def test_matches_pairwise_distance(self):
+        points = [
+            Cartesian2D(0.1, 0.1),
+            Cartesian2D(0.9, 0.2),
+            Cartesian2D(0.5, 0.95),
+            Cartesian2D(2.3, -1.4),
+        ]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        pair_distances = operations.periodic_relative_pair_distances(points, box)
+        expected = [
+            measure.periodic_euclidean_distance(p0, p1, box)
+            for (p0, p1) in itertools.combinations(points, 2)
+        ]
+
+        assert pair_distances == pytest.approx(expected)
+
+    def test_squared(self):
+        points = [
+            Cartesian2D(0.1, 0.1),
+            Cartesian2D(0.9, 0.8),
+        ]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        pair_distances_sq = operations.periodic_relative_pair_distances_squared(
+            points, box
+        )
+        assert pair_distances_sq == pytest.approx([0.2**2 + 0.3**2])
+
+    def test_no_points(self):
+        box = PeriodicBoxSides2D(1.0, 1.0)
+        assert operations.periodic_relative_pair_distances([], box) == []
+
+    def test_raises_wrong_boxdimension(self):
+        points = [Cartesian3D(0.0, 0.0, 0.0), Cartesian3D(1.0, 2.0, 3.0)]
+        box = PeriodicBoxSides2D(1.0, 1.0)
+
+        with pytest.raises(RuntimeError):
+            operations.periodic_relative_pair_distances(points, box)
+
 
 class Test_cross_product:
     @pytest.mark.parametrize(
@@ -54,6 +54,12 @@ def test_periodic_box_not_eq(box1, box2):
     assert box1 != box2
 
 
+def test_periodic_box_hash():
+    box = PeriodicBoxSides2D(1.5, 3.3)
+    assert hash(box) == hash(PeriodicBoxSides2D(1.5, 3.3))
+    assert hash(box) == hash((1.5, 3.3))
+
+
 def test_periodic_box_repr():
     box = PeriodicBoxSides2D(1.5, 3.3)
     assert repr(box) == "PeriodicBoxSides(1.500000, 3.300000)"
@@ -70,7 +76,27 @@ def test_periodic_box_coordinates():
     # fmt: on
 
 
+def test_periodic_box_coordinates_tuple():
+    box = PeriodicBoxSides3D(1, 2.5, 3)
+    assert box.coordinates == (1.0, 2.5, 3.0)
+
+
+def test_periodic_box_inv_coordinates():
+    box = PeriodicBoxSides3D(0.5, 2.0, 4.0)
+    assert box.inv_coordinates == pytest.approx((2.0, 0.5, 0.25))
+
+
 @pytest.mark.parametrize("sidelengths", [(1.0, -1.0), (0.0, 1.0), (3.0, 0.0)])
 def test_periodic_box_invalid(sidelengths):
     with pytest.raises(ValueError):
         PeriodicBoxSides2D(*sidelengths)
+
+
+def test_periodic_box_rejects_strings():
+    with pytest.raises(TypeError):
+        PeriodicBoxSides1D("2")
+
+
+def test_periodic_box_no_instance_dict():
+    box = PeriodicBoxSides3D(1.0, 2.0, 3.0)
+    assert not hasattr(box, "__dict__")
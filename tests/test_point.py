@@ -15,114 +15,53 @@ def test_origins():
     assert Cartesian3D.origin() == Cartesian3D(0.0, 0.0, 0.0)
 
 
-def test_addition_and_subtraction_1D():
-    # TODO: replace this boilerplate with a fixture
-    n_samples = 10
-    lower_bound = -10.0
-    upper_bound = 10.0
+N_SAMPLES = 10
+LOWER_BOUND = -10.0
+UPPER_BOUND = 10.0
 
-    for i in range(n_samples):
-        x0 = random.uniform(lower_bound, upper_bound)
-        x1 = random.uniform(lower_bound, upper_bound)
+POINT_TYPES = {1: Cartesian1D, 2: Cartesian2D, 3: Cartesian3D}
 
-        p0 = Cartesian1D(x0)
-        p1 = Cartesian1D(x1)
 
-        p_add01 = p0 + p1
-        assert p_add01[0] == pytest.approx(x0 + x1)
-
-        p_sub01 = p0 - p1
-        assert p_sub01[0] == pytest.approx(x0 - x1)
+@pytest.fixture(scope="module")
+def rng():
+    return random.Random(0)
 
 
-def test_addition_and_subtraction_2D():
-    # TODO: replace this boilerplate with a fixture
-    n_samples = 10
-    lower_bound = -10.0
-    upper_bound = 10.0
+@pytest.mark.parametrize("n_dims", [1, 2, 3])
+def test_addition_and_subtraction(rng, n_dims):
+    point_type = POINT_TYPES[n_dims]
 
-    for i in range(n_samples):
-        x0 = random.uniform(lower_bound, upper_bound)
-        x1 = random.uniform(lower_bound, upper_bound)
-        y0 = random.uniform(lower_bound, upper_bound)
-        y1 = random.uniform(lower_bound, upper_bound)
+    for i in range(N_SAMPLES):
+        coords0 = [rng.uniform(LOWER_BOUND, UPPER_BOUND) for _ in range(n_dims)]
+        coords1 = [rng.uniform(LOWER_BOUND, UPPER_BOUND) for _ in range(n_dims)]
 
-        p0 = Cartesian2D(x0, y0)
-        p1 = Cartesian2D(x1, y1)
+        p0 = point_type(*coords0)
+        p1 = point_type(*coords1)
 
         p_add01 = p0 + p1
-        assert p_add01[0] == pytest.approx(x0 + x1)
-        assert p_add01[1] == pytest.approx(y0 + y1)
+        assert p_add01.coordinates == pytest.approx(
+            [c0 + c1 for (c0, c1) in zip(coords0, coords1)]
+        )
 
         p_sub01 = p0 - p1
-        assert p_sub01[0] == pytest.approx(x0 - x1)
-        assert p_sub01[1] == pytest.approx(y0 - y1)
+        assert p_sub01.coordinates == pytest.approx(
+            [c0 - c1 for (c0, c1) in zip(coords0, coords1)]
+        )
 
 
-def test_addition_and_subtraction_3D():
-    # TODO: replace this boilerplate with a fixture
-    n_samples = 10
-    lower_bound = -10.0
-    upper_bound = 10.0
+@pytest.mark.parametrize("n_dims", [1, 2, 3])
+def test_multiplication(rng, n_dims):
+    point_type = POINT_TYPES[n_dims]
 
-    for i in range(n_samples):
-        x0 = random.uniform(lower_bound, upper_bound)
-        x1 = random.uniform(lower_bound, upper_bound)
-        y0 = random.uniform(lower_bound, upper_bound)
-        y1 = random.uniform(lower_bound, upper_bound)
-        z0 = random.uniform(lower_bound, upper_bound)
-        z1 = random.uniform(lower_bound, upper_bound)
+    for i in range(N_SAMPLES):
+        scale = rng.uniform(LOWER_BOUND, UPPER_BOUND)
+        coords0 = [rng.uniform(LOWER_BOUND, UPPER_BOUND) for _ in range(n_dims)]
 
-        p0 = Cartesian3D(x0, y0, z0)
-        p1 = Cartesian3D(x1, y1, z1)
+        p0 = point_type(*coords0)
+        expected = pytest.approx([scale * c0 for c0 in coords0])
 
-        p_add01 = p0 + p1
-        assert p_add01[0] == pytest.approx(x0 + x1)
-        assert p_add01[1] == pytest.approx(y0 + y1)
-        assert p_add01[2] == pytest.approx(z0 + z1)
-
-        p_sub01 = p0 - p1
-        assert p_sub01[0] == pytest.approx(x0 - x1)
-        assert p_sub01[1] == pytest.approx(y0 - y1)
-        assert p_sub01[2] == pytest.approx(z0 - z1)
-
-
-def test_multiplication_1D2D3D():
-    # TODO: replace this boilerplate with a fixture
-    n_samples = 10
-    lower_bound = -10.0
-    upper_bound = 10.0
-
-    for i in range(n_samples):
-        scale = random.uniform(lower_bound, upper_bound)
-        x0 = random.uniform(lower_bound, upper_bound)
-        y0 = random.uniform(lower_bound, upper_bound)
-        z0 = random.uniform(lower_bound, upper_bound)
-
-        p0_1d = Cartesian1D(x0)
-        p0_2d = Cartesian2D(x0, y0)
-        p0_3d = Cartesian3D(x0, y0, z0)
-
-        p0_1d_left = scale * p0_1d
-        p0_1d_right = p0_1d * scale
-        assert p0_1d_left[0] == pytest.approx(scale * x0)
-        assert p0_1d_right[0] == pytest.approx(scale * x0)
-
-        p0_2d_left = scale * p0_2d
-        p0_2d_right = p0_2d * scale
-        assert p0_2d_left[0] == pytest.approx(scale * x0)
-        assert p0_2d_right[0] == pytest.approx(scale * x0)
-        assert p0_2d_left[1] == pytest.approx(scale * y0)
-        assert p0_2d_right[1] == pytest.approx(scale * y0)
-
-        p0_3d_left = scale * p0_3d
-        p0_3d_right = p0_3d * scale
-        assert p0_3d_left[0] == pytest.approx(scale * x0)
-        assert p0_3d_right[0] == pytest.approx(scale * x0)
-        assert p0_3d_left[1] == pytest.approx(scale * y0)
-        assert p0_3d_right[1] == pytest.approx(scale * y0)
-        assert p0_3d_left[2] == pytest.approx(scale * z0)
-        assert p0_3d_right[2] == pytest.approx(scale * z0)
+        assert (scale * p0).coordinates == expected
+        assert (p0 * scale).coordinates == expected
 
 
 def test_hash():
@@ -130,6 +69,135 @@ def test_hash():
     assert hash(p) == hash((1.0, 2.0))
 
 
+def test_hash_as_key():
+    points = {Cartesian2D(1.0, 2.0): "a", Cartesian3D(1.0, 2.0, 3.0): "b"}
+
+    assert points[Cartesian2D(1.0, 2.0)] == "a"
+    assert points[Cartesian3D(1.0, 2.0, 3.0)] == "b"
+
+
 def test_origin():
     p = CartesianND.origin(3)
     assert list(p.coordinates) == [0.0, 0.0, 0.0]
+
+
+def test_origin_is_shared():
+    assert Cartesian1D.origin() is Cartesian1D.origin()
+    assert Cartesian2D.origin() is Cartesian2D.origin()
+    assert Cartesian3D.origin() is Cartesian3D.origin()
+    assert CartesianND.origin(4) is CartesianND.origin(4)
+    assert CartesianND.origin(4) is not CartesianND.origin(5)
+
+
+@pytest.mark.parametrize(
+    "point",
+    [
+        Cartesian1D(1.0),
+        Cartesian2D(1.0, 2.0),
+        Cartesian3D(1.0, 2.0, 3.0),
+        CartesianND.origin(4),
+    ],
+)
+def test_no_instance_dict(point):
+    assert not hasattr(point, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "p0, p1",
+    [
+        (Cartesian1D(1.0), Cartesian1D(2.0)),
+        (Cartesian2D(1.0, 2.0), Cartesian2D(3.0, -4.0)),
+        (Cartesian3D(1.0, 2.0, 3.0), Cartesian3D(3.0, -4.0, 5.0)),
+    ],
+)
+def test_operators_keep_type(p0, p1):
+    p0_nd = CartesianND(p0.coordinates)
+    p1_nd = CartesianND(p1.coordinates)
+
+    for (result, expected) in [
+        (p0 + p1, p0_nd + p1_nd),
+        (p0 - p1, p0_nd - p1_nd),
+        (p0 * 2.5, p0_nd * 2.5),
+        (2.5 * p0, 2.5 * p0_nd),
+        (p0 / 2.5, p0_nd / 2.5),
+        (p0 // 2.5, p0_nd // 2.5),
+    ]:
+        assert type(result) is type(p0)
+        assert result == expected
+
+
+def test_add_mismatched_dims():
+    with pytest.raises(TypeError):
+        Cartesian3D(1.0, 2.0, 3.0) + Cartesian2D(1.0, 2.0)
+
+
+@pytest.mark.parametrize(
+    "point", [Cartesian1D(1.0), Cartesian2D(1.0, 2.0), Cartesian3D(1.0, 2.0, 3.0)]
+)
+def test_divide_by_zero(point):
+    with pytest.raises(ZeroDivisionError):
+        point / 0.0
+    with pytest.raises(ZeroDivisionError):
+        point // 0.0
+
+
+@pytest.mark.parametrize(
+    "make_point",
+    [
+        lambda: Cartesian1D("1.5"),
+        lambda: Cartesian2D(1.0, b"2.0"),
+        lambda: Cartesian3D(1.0, 2.0, "3.0"),
+    ],
+)
+def test_rejects_strings(make_point):
+    with pytest.raises(TypeError):
+        make_point()
+
+
+def test_accepts_ints():
+    assert Cartesian3D(1, 2, 3).coordinates == (1.0, 2.0, 3.0)
+
+
+@pytest.mark.parametrize(
+    "point", [Cartesian1D(1.0), Cartesian2D(1.0, 2.0), Cartesian3D(1.0, 2.0, 3.0)]
+)
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda p, other: p * other,
+        lambda p, other: other * p,
+        lambda p, other: p / other,
+        lambda p, other: p // other,
+    ],
+)
+@pytest.mark.parametrize("other_kind", ["point", "complex"])
+def test_non_real_scalar_raises(point, operation, other_kind):
+    other = point if other_kind == "point" else 2j
+    with pytest.raises(TypeError):
+        operation(point, other)
+
+
+def test_nd_coordinates_are_floats():
+    point = CartesianND([1, 2])
+    assert point.coordinates == (1.0, 2.0)
+    assert all(type(coord) is float for coord in (point // 2).coordinates)
+
+
+def test_nd_rejects_strings():
+    with pytest.raises(TypeError):
+        CartesianND(["1.5", 2.0])
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda p, other: p * other,
+        lambda p, other: other * p,
+        lambda p, other: p / other,
+        lambda p, other: p // other,
+    ],
+)
+@pytest.mark.parametrize("other", [CartesianND([1.0, 2.0]), 2j])
+def test_nd_non_real_scalar_raises(operation, other):
+    with pytest.raises(TypeError):
+        operation(CartesianND([1.0, 2.0]), other)
@@ -0,0 +1,106 @@
+import pytest
+
+from cartesian import Cartesian2D
+from cartesian import Cartesian3D
+from cartesian import Cartesian3DArray
+from cartesian import operations
+from cartesian import PeriodicBoxSides3D
+
+
+def default_points():
+    return [
+        Cartesian3D(1.0, 2.0, 3.0),
+        Cartesian3D(4.0, 5.0, 6.0),
+        Cartesian3D(-7.0, 8.0, -9.0),
+    ]
+
+
+def test_from_points():
+    points = default_points()
+    point_array = Cartesian3DArray.from_points(points)
+
+    assert len(point_array) == len(points)
+    assert list(point_array) == points
+
+
+def test_from_points_raises_wrong_dimension():
+    with pytest.raises(ValueError):
+        Cartesian3DArray.from_points([Cartesian2D(1.0, 2.0)])
+
+
+def test_columns():
+    point_array = Cartesian3DArray.from_points(default_points())
+    xs, ys, zs = point_array.columns
+
+    assert list(xs) == [1.0, 4.0, -7.0]
+    assert list(ys) == [2.0, 5.0, 8.0]
+    assert list(zs) == [3.0, 6.0, -9.0]
+
+
+def test_columns_raises_different_lengths():
+    with pytest.raises(ValueError):
+        Cartesian3DArray([1.0, 2.0], [3.0, 4.0], [5.0])
+
+
+def test_zeros():
+    point_array = Cartesian3DArray.zeros(4)
+
+    assert len(point_array) == 4
+    assert all([point == Cartesian3D.origin() for point in point_array])
+
+
+def test_setitem():
+    point_array = Cartesian3DArray.zeros(2)
+    point_array[1] = Cartesian3D(1.0, 2.0, 3.0)
+
+    assert point_array[0] == Cartesian3D.origin()
+    assert point_array[1] == Cartesian3D(1.0, 2.0, 3.0)
+
+
+def test_slice():
+    point_array = Cartesian3DArray.from_points(default_points())
+    sliced = point_array[1:]
+
+    assert isinstance(sliced, Cartesian3DArray)
+    assert list(sliced) == default_points()[1:]
+
+
+def test_repr():
+    point_array = Cartesian3DArray.from_points([Cartesian3D(1.0, 2.0, 3.0)])
+    assert repr(point_array) == "Cartesian3DArray([(1.000000, 2.000000, 3.000000)])"
+
+
+def test_relative_pair_distances_matches_list():
+    points = default_points()
+    point_array = Cartesian3DArray.from_points(points)
+
+    # fmt: off
+    assert (
+        operations.relative_pair_distances(point_array)
+        == pytest.approx(operations.relative_pair_distances(points))
+    )
+    # fmt: on
+
+
+def test_periodic_relative_pair_distances_matches_list():
+    points = default_points()
+    point_array = Cartesian3DArray.from_points(points)
+    box = PeriodicBoxSides3D(2.0, 3.0, 4.0)
+
+    # fmt: off
+    assert (
+        operations.periodic_relative_pair_distances(point_array, box)
+        == pytest.approx(operations.periodic_relative_pair_distances(points, box))
+    )
+    # fmt: on
+
+
+def test_shift_points_together_matches_list():
+    points = default_points()
+    point_array = Cartesian3DArray.from_points(points)
+    box = PeriodicBoxSides3D(2.0, 3.0, 4.0)
+
+    shifted_from_array = operations.shift_points_together(point_array, box)
+    shifted_from_list = operations.shift_points_together(points, box)
+
+    assert shifted_from_array == shifted_from_list